@@ -1,13 +1,22 @@
 import re
+import sys
 import time
+import gzip
 import json
+import hashlib
+import random
+import asyncio
 import argparse
 import functools
 import logging
 from pathlib import Path
 from urllib.parse import urljoin
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from selectolax.lexbor import LexborHTMLParser
+import lxml.html
+from lxml import etree
 
 # configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,97 +25,437 @@ logger = logging.getLogger(__name__)
 # constants
 SCRAPER_DIR = Path("scraper")
 SCRAPER_DIR.mkdir(exist_ok=True)
+CATEGORIES_CACHE = SCRAPER_DIR / ".categories.json"
+CATEGORIES_CACHE_TTL = 24 * 60 * 60  # seconds
+PAGE_CACHE_DIR = SCRAPER_DIR / ".cache"
+PAGE_CACHE_TTL = 24 * 60 * 60  # seconds
+# Fast gzip level: pages compress almost as well as at the default 9 for a fraction of the CPU time
+PAGE_CACHE_COMPRESSLEVEL = 1
 
-def retry(times=3, delay=2):
+# Specific User-Agent to avoid headless detection
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/115.0"
+
+# Requests we never need: the scraper only reads server-rendered JSON from the HTML.
+# Stylesheets are kept because the listing page relies on is_visible() checks, and
+# Bazaarvoice scripts are kept because they render the rating used by the fallbacks.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "texttrack", "manifest"}
+BLOCKED_URL_PARTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "adservice.google",
+    "connect.facebook.net", "bat.bing.com", "hotjar.com",
+    "bazaarvoice-cdn-images",
+)
+
+# Product card selectors, shared by the Playwright pagination loop and the HTML parse
+CARD_SELECTOR = "div[class*='mh-product-card']"
+CARD_FALLBACK_SELECTOR = "div[role='group'][aria-label]"
+# Pagination controls
+# has-text is case-insensitive; the aria-label branch covers icon-only buttons
+LOAD_MORE_SELECTOR = "button:has-text('Load More'), button[aria-label*='Load More' i]"
+VIEW_ALL_TOGGLE_SELECTOR = "input[type='checkbox'][aria-label*='View All']"
+# Card count in the page, using the fallback selector when no mh-product-card exists
+CARD_COUNT_JS = "([sel, fallback]) => document.querySelectorAll(sel).length || document.querySelectorAll(fallback).length"
+CARDS_GREW_JS = "([sel, fallback, prev]) => (document.querySelectorAll(sel).length || document.querySelectorAll(fallback).length) > prev"
+# [name, href] of each card, matching _parse_listing_cards, so pagination rounds avoid serializing the page
+CARD_LINKS_JS = """([sel, fallback]) => {
+    let cards = document.querySelectorAll(sel);
+    if (!cards.length) {
+        cards = document.querySelectorAll(fallback);
+    }
+    const links = [];
+    for (const card of cards) {
+        const name = card.getAttribute('aria-label') || card.querySelector('h3')?.textContent.trim();
+        // Some cards are wrapped in the link instead of containing it
+        const link = card.querySelector('a[href]') || card.parentElement?.closest('a[href]');
+        if (name !== undefined && link) {
+            links.push([name, link.getAttribute('href')]);
+        }
+    }
+    return links;
+}"""
+
+# Embedded JSON scripts on product pages, matched directly on the raw HTML
+_NEXT_DATA_RE = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+_BV_JSONLD_RE = re.compile(r'<script[^>]*\bid="bv-jsonld-reviews-data"[^>]*>(.*?)</script>', re.DOTALL)
+# Browser fallback: both embedded JSON scripts parsed in the page, null when absent or invalid
+PAGE_JSON_JS = """() => {
+    const parse = id => {
+        const el = document.getElementById(id);
+        try {
+            return el ? JSON.parse(el.textContent) : null;
+        } catch (e) {
+            return null;
+        }
+    };
+    return [parse('__NEXT_DATA__'), parse('bv-jsonld-reviews-data')];
+}"""
+# Rating fallbacks when JSON-LD is missing, in order of preference:
+# 1. Offscreen text (e.g., "3.8 out of 5 stars")
+# 2. Visual container (e.g., "4.8")
+# The opening tag is found with a regex and only the fragment after it is parsed for the element's text
+_RATING_TEXT_RES = (
+    (re.compile(r'<span[^>]*class="[^"]*\bbv_offscreen_text\b'), "span.bv_offscreen_text"),
+    (re.compile(r'<div[^>]*class="[^"]*\bbv_avgRating_component_container\b'), "div.bv_avgRating_component_container"),
+)
+RATING_FRAGMENT_SIZE = 4096  # characters
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# DOM spec fallback: spec labels to look for, and XPath expressions compiled once
+KNOWN_SPEC_KEYS = ("Display Resolution", "Resolution", "Screen Size", "Refresh Rate", "Speakers", "Power", "Sound", "Capacity", "Dimensions")
+_SPEC_KEY_XPATH = etree.XPath("//text()[normalize-space(.) = $key]/..")
+_CHILD_DIVS_XPATH = etree.XPath("./div")
+_TEXT_XPATH = etree.XPath("normalize-space(.)")
+
+# clean_text tables, built once since it runs per feature and per spec value.
+# A single translate() pass normalizes smart quotes and dashes and deletes superscripts,
+# trademark/registered/copyright symbols and zero-width characters (which \s doesn't match)
+_CLEAN_TABLE = str.maketrans({
+    '\u2018': "'", '\u2019': "'",
+    '\u201C': '"', '\u201D': '"',
+    '\u2013': '-', '\u2014': '-',
+    **dict.fromkeys('\u00B9\u00B2\u00B3\u00AE\u2122\u00A9', None),
+    **dict.fromkeys(map(chr, range(0x2070, 0x20A0)), None),
+    **dict.fromkeys('\u200B\u200C\u200D\uFEFF', None),
+})
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Transient failures worth retrying: browser/network errors and truncated JSON payloads
+RETRYABLE_ERRORS = (PlaywrightError, httpx.HTTPError, json.JSONDecodeError)
+
+def _backoff(delay, attempt):
+    # Exponential backoff with jitter so concurrent retries don't fire in lockstep
+    return delay * (2 ** attempt) + random.random()
+
+def retry(times=3, delay=2, exceptions=RETRYABLE_ERRORS):
+    """
+    Retries on `exceptions` with exponential backoff and re-raises the last error
+    once all attempts fail. Other exceptions propagate immediately.
+    """
 
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for i in range(times):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        logger.warning(f"Attempt {i+1}/{times} failed for {func.__name__}: {e}")
+                        if i + 1 == times:
+                            logger.error(f"All {times} attempts failed for {func.__name__}")
+                            raise
+                        await asyncio.sleep(_backoff(delay, i))
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             for i in range(times):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except exceptions as e:
                     logger.warning(f"Attempt {i+1}/{times} failed for {func.__name__}: {e}")
-                    time.sleep(delay)
-            logger.error(f"All {times} attempts failed for {func.__name__}")
-            return None
+                    if i + 1 == times:
+                        logger.error(f"All {times} attempts failed for {func.__name__}")
+                        raise
+                    time.sleep(_backoff(delay, i))
         return wrapper
     return decorator
 
+def _cache_path(url):
+    return PAGE_CACHE_DIR / f"{hashlib.blake2b(url.encode()).hexdigest()}.html.gz"
+
+def _cache_get(url, ttl=PAGE_CACHE_TTL):
+    """
+    Returns the cached HTML for a URL, or None if it is missing or older than `ttl` seconds.
+    """
+    path = _cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
+    except (OSError, EOFError):
+        return None
+
+def _cache_put(url, content):
+    PAGE_CACHE_DIR.mkdir(exist_ok=True)
+    with gzip.open(_cache_path(url), "wt", compresslevel=PAGE_CACHE_COMPRESSLEVEL, encoding="utf-8") as f:
+        f.write(content)
+
+def _rating_from_markup(content):
+    """
+    Returns the first number in the rendered rating markup, or None if there is none.
+    """
+    for pattern, selector in _RATING_TEXT_RES:
+        tag = pattern.search(content)
+        if tag:
+            fragment = content[tag.start():tag.start() + RATING_FRAGMENT_SIZE]
+            elem = LexborHTMLParser(fragment).css_first(selector)
+            # Extract the first float-like number found in the text
+            match = _NUMBER_RE.search(elem.text(strip=True)) if elem else None
+            if match:
+                return match.group(0)
+    return None
+
+def _has_rating(content):
+    """
+    Returns whether the HTML already carries a rating, either as Bazaarvoice JSON-LD or as a number in its rendered markup.
+    """
+    bv_script = _BV_JSONLD_RE.search(content)
+    if bv_script and '"aggregateRating"' in bv_script.group(1):
+        return True
+    return _rating_from_markup(content) is not None
+
+def _saved_urls(path):
+    """
+    Returns the product URLs already in a JSON Lines results file.
+    A partially written last line (e.g. from a crash) is truncated away so appends stay valid.
+    """
+    urls = set()
+    valid_size = 0
+    with open(path, "r+b") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            if line.strip():
+                urls.add(orjson.loads(line)["url"])
+            valid_size += len(line)
+        f.truncate(valid_size)
+    return urls
+
+def jsonl_to_json(path):
+    """
+    Converts a JSON Lines results file into an indented JSON array next to it.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        results = [orjson.loads(line) for line in f if line.strip()]
+    
+    array_file = path.with_suffix(".json")
+    with open(array_file, "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    return array_file
+
+class PagePool:
+    """
+    Fixed-size pool of warm pages in one browser context, handed out with acquire()/release().
+    """
+    
+    def __init__(self, context, size, max_uses):
+        self.context = context
+        self.size = size
+        # Pages are closed and recreated after this many navigations to bound memory growth
+        self.max_uses = max_uses
+        self._pages = None
+        self._uses = {}
+        # Pages currently owned by the pool, in the queue or handed out
+        self._live = 0
+        self._error = None
+
+    async def start(self):
+        self._pages = asyncio.Queue()
+        for _ in range(self.size):
+            await self._add_page()
+
+    async def _add_page(self):
+        page = await self.context.new_page()
+        self._uses[page] = 0
+        self._live += 1
+        self._pages.put_nowait(page)
+
+    async def acquire(self):
+        page = await self._pages.get()
+        if page is None:
+            # Pass the wake-up on to the next waiter and fail instead of blocking forever
+            self._pages.put_nowait(None)
+            raise RuntimeError("Page pool has no pages left") from self._error
+        return page
+
+    async def release(self, page):
+        self._uses[page] += 1
+        # Crashed or closed pages are replaced right away instead of failing their remaining uses
+        if self._uses[page] < self.max_uses and not page.is_closed():
+            self._pages.put_nowait(page)
+            return
+
+        del self._uses[page]
+        self._live -= 1
+        try:
+            await page.close()
+        except PlaywrightError as e:
+            logger.debug(f"Closing recycled page failed: {e}")
+        try:
+            await self._add_page()
+        except PlaywrightError as e:
+            logger.error(f"Could not replace recycled page: {e}")
+            if self._live == 0:
+                self._error = e
+                self._pages.put_nowait(None)
+
 class LGScraper:
     BASE_URL = "https://www.lg.com/us/"
+    # Max product details fetched at once (mostly plain HTTP requests)
+    CONCURRENCY = 32
+    # Warm browser pages shared by detail fetches that need the browser fallback
+    BROWSER_PAGES = 4
+    # Upper bound on time spent loading more listing cards, in seconds
+    PAGINATION_TIMEOUT = 180
+    # Pooled pages are closed and recreated after this many navigations
+    PAGE_MAX_USES = 50
     
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, concurrency=CONCURRENCY, browser_pages=BROWSER_PAGES, use_cache=True, refresh_categories=False):
         self.headless = headless
+        self.concurrency = concurrency
+        self.browser_pages = browser_pages
+        self.use_cache = use_cache
+        self.refresh_categories = refresh_categories
         self.categories = {}
+        self._token_index = {}
+        self._query_cache = {}
         self.products_data = []
+        self._http = None
+        self._page_pool = None
+
+    async def _fetch_html(self, url):
+        """
+        Fetches the raw server HTML for a URL without a browser. Returns None on failure.
+        """
+        try:
+            resp = await self._http.get(url)
+            resp.raise_for_status()
+            return resp.text
+        except httpx.HTTPError as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+    async def _block_heavy_requests(self, route):
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+            await route.abort()
+        else:
+            await route.continue_()
 
     def clean_text(self, text):
         if not text: 
             return ""
         
-        # Convert to string just in case
-        text = str(text)
-        
-        text = re.sub(r'[\u00B9\u00B2\u00B3\u2070-\u209F]', '', text)
-        
-        # Remove Trademark, Registered, Copyright symbols
-        text = re.sub(r'[\u00AE\u2122\u00A9]', '', text)
-        
-        # Normalize smart quotes and dashes
-        text = text.replace('\u2018', "'").replace('\u2019', "'")
-        text = text.replace('\u201C', '"').replace('\u201D', '"')
-        text = text.replace('\u2013', '-').replace('\u2014', '-')
+        # Convert to string just in case, normalize punctuation and drop symbols
+        text = str(text).translate(_CLEAN_TABLE)
         
         # Clean extra whitespace
-        return re.sub(r'\s+', ' ', text).strip()
+        return _WHITESPACE_RE.sub(' ', text).strip()
+
+    def _load_cached_categories(self):
+        """
+        Loads categories from the on-disk cache if it is fresh. Returns True on success.
+        """
+        if self.refresh_categories:
+            return False
+        try:
+            if time.time() - CATEGORIES_CACHE.stat().st_mtime >= CATEGORIES_CACHE_TTL:
+                return False
+            categories = orjson.loads(CATEGORIES_CACHE.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            # A missing or corrupt cache just means rediscovering
+            logger.debug(f"Categories cache unusable: {e}")
+            return False
+        self.categories = categories
+        logger.info(f"Loaded {len(self.categories)} categories from {CATEGORIES_CACHE}.")
+        self._index_categories()
+        return True
 
-    def discover_categories(self):
+    async def discover_categories(self, browser=None):
+        """
+        Loads categories from cache or discovers them. Reuses `browser` if given,
+        otherwise launches (and closes) a browser of its own.
+        """
+        if self._load_cached_categories():
+            return
+
+        if browser is not None:
+            page = await browser.new_page()
+            try:
+                await self._discover_on(page)
+            finally:
+                await page.close()
+            return
+
+        async with async_playwright() as p:
+            browser = await p.firefox.launch(headless=self.headless)
+            try:
+                await self._discover_on(await browser.new_page())
+            finally:
+                await browser.close()
+
+    async def _discover_on(self, page):
+        """
+        Discovers categories from the homepage using an already open page.
+        """
         logger.info("Discovering categories from homepage...")
-        with sync_playwright() as p:
-            browser = p.firefox.launch(headless=self.headless)
-            page = browser.new_page()
+        try:
+            await page.goto(self.BASE_URL, timeout=60000, wait_until="domcontentloaded")
             
-            try:
-                page.goto(self.BASE_URL, timeout=60000, wait_until="domcontentloaded")
-                
-                # Extract links from the page that look like categories
-                links = page.evaluate("""() => {
-                    const anchors = Array.from(document.querySelectorAll('a'));
-                    return anchors.map(a => ({
-                        text: a.innerText.trim(),
-                        href: a.href
-                    })).filter(link => 
-                        link.text.length > 0 && 
-                        link.href.includes('/us/') && 
-                        !link.href.includes('/support') &&
-                        !link.href.includes('/business')
-                    );
-                }""")
-                
-                for link in links:
-                    name = link['text'].lower()
-                    href = link['href']
-                    if name not in self.categories:
-                        self.categories[name] = href
-                        
-                logger.info(f"Discovered {len(self.categories)} potential categories.")
-                
-            except Exception as e:
-                logger.error(f"Failed to discover categories: {e}")
-                self.categories = {
-                    "oled tvs": "https://www.lg.com/us/oled-tvs",
-                    "refrigerators": "https://www.lg.com/us/refrigerators",
-                    "washers": "https://www.lg.com/us/washers-dryers",
-                    "speakers": "https://www.lg.com/us/speakers"
+            # Extract links that look like categories, deduplicated by name in the page
+            # so only unique entries cross back to Python (first link per name wins)
+            self.categories.update(await page.evaluate("""() => {
+                const categories = new Map();
+                for (const a of document.querySelectorAll('a')) {
+                    const name = a.innerText.trim().toLowerCase();
+                    const href = a.href;
+                    if (name && !categories.has(name) &&
+                        href.includes('/us/') &&
+                        !href.includes('/support') &&
+                        !href.includes('/business')) {
+                        categories.set(name, href);
+                    }
                 }
-            finally:
-                browser.close()
+                return Object.fromEntries(categories);
+            }"""))
+                    
+            logger.info(f"Discovered {len(self.categories)} potential categories.")
+            # An empty map (e.g. from a bot-check page) must not be cached over the defaults below
+            if not self.categories:
+                raise ValueError("no category links found on the homepage")
+            # Written to a temp file and renamed so an interrupted write can't leave a truncated cache
+            tmp = CATEGORIES_CACHE.with_suffix(".json.tmp")
+            try:
+                tmp.write_bytes(orjson.dumps(self.categories))
+                tmp.replace(CATEGORIES_CACHE)
+            except OSError as e:
+                logger.warning(f"Could not write categories cache: {e}")
+            
+        except Exception as e:
+            logger.error(f"Failed to discover categories: {e}")
+            self.categories = {
+                "oled tvs": "https://www.lg.com/us/oled-tvs",
+                "refrigerators": "https://www.lg.com/us/refrigerators",
+                "washers": "https://www.lg.com/us/washers-dryers",
+                "speakers": "https://www.lg.com/us/speakers"
+            }
+
+        self._index_categories()
+
+    def _index_categories(self):
+        """
+        Maps each word of a category name to its URL. Words shared by several categories are left out.
+        """
+        index = {}
+        ambiguous = set()
+        for cat_name, url in self.categories.items():
+            for token in cat_name.split():
+                if index.setdefault(token, url) != url:
+                    ambiguous.add(token)
+        self._token_index = {token: url for token, url in index.items() if token not in ambiguous}
+        # Resolved queries are only valid for the categories they were matched against
+        self._query_cache = {}
 
     def get_category_url(self, user_query):
         
         query = user_query.lower().strip()
-        
+        if query not in self._query_cache:
+            self._query_cache[query] = self._match_category(query, user_query)
+        return self._query_cache[query]
+
+    def _match_category(self, query, user_query):
         # Exact match
         if query in self.categories:
             return self.categories[query]
@@ -116,28 +465,54 @@ class LGScraper:
             if query in cat_name or cat_name in query:
                 logger.info(f"Matched query '{user_query}' to category '{cat_name}'")
                 return url
-        
+
+        # Token match, only when every query word points at the same category
+        urls = {self._token_index.get(token) for token in query.split()}
+        if len(urls) == 1 and None not in urls:
+            url = urls.pop()
+            logger.info(f"Matched query '{user_query}' to category keywords at {url}")
+            return url
+
         # Fallback: construct slug
-        slug = query.replace(" ", "-")
-        url = f"https://www.lg.com/us/{slug}"
+        url = self._slug_url(query)
         logger.warning(f"No direct category match found. Trying constructed URL: {url}")
         return url
 
+    def _slug_url(self, query):
+        slug = query.lower().strip().replace(" ", "-")
+        return urljoin(self.BASE_URL, slug)
+
+    async def _prefetch(self, page, url):
+        """
+        Speculatively loads a likely listing URL to warm DNS, TLS and asset caches. Failures are ignored.
+        """
+        try:
+            await page.goto(url, timeout=60000, wait_until="domcontentloaded")
+        except Exception as e:
+            logger.debug(f"Speculative load of {url} failed: {e}")
+
     @retry(times=3, delay=5)
-    def scrape_listing_page(self, page, url):
+    async def scrape_listing_page(self, page, url, queue=None):
         """
         Navigates to the listing page and loads all products via infinite scroll.
+        If a queue is given, products are pushed to it as soon as their cards render.
         """
         logger.info(f"Navigating to listing page: {url}")
         
-        page.goto(url, timeout=60000, wait_until="domcontentloaded")
+        await page.goto(url, timeout=60000, wait_until="domcontentloaded")
+        
+        # Locators are lazy, so they are built once and re-queried on each use
+        view_all_toggle = page.locator(VIEW_ALL_TOGGLE_SELECTOR).first
+        load_more_btn = page.locator(LOAD_MORE_SELECTOR).first
+        card_selectors = [CARD_SELECTOR, CARD_FALLBACK_SELECTOR]
         
         try:
-            cookie_accept = page.get_by_text("Accept All", exact=False)
-            if cookie_accept.count() > 0 and cookie_accept.first.is_visible():
-                logger.info("Accepting cookies...")
-                cookie_accept.first.click()
-                time.sleep(2)
+            cookie_accept = page.get_by_text("Accept All", exact=False).first
+            # click() waits for visibility itself, so a timeout just means there is no banner
+            await cookie_accept.click(timeout=2000)
+            logger.info("Accepted cookies.")
+            # Continue as soon as the banner is dismissed
+            await cookie_accept.wait_for(state="hidden", timeout=3000)
         except Exception:
             pass
 
@@ -145,301 +520,470 @@ class LGScraper:
         try:
             
             logger.info("Checking for 'View All' toggle...")
-            time.sleep(3)
+            # The toggle renders with the product grid, so wait for the first cards instead of a fixed delay
+            try:
+                await page.wait_for_function(CARD_COUNT_JS, arg=card_selectors, timeout=10000)
+            except PlaywrightTimeoutError:
+                logger.debug("No product cards rendered before the 'View All' check.")
             
-            toggle_input = page.locator("input[type='checkbox'][aria-label*='View All']")
-            if toggle_input.count() > 0:
-                if not toggle_input.first.is_checked():
+            # networkidle rarely settles on ad-heavy pages, so wait for the extra cards instead
+            initial_count = await page.evaluate(CARD_COUNT_JS, card_selectors)
+            if await view_all_toggle.count() > 0:
+                if not await view_all_toggle.is_checked():
                      logger.info("Toggling 'View All' via input...")
-                     toggle_input.first.check(force=True)
-                     page.wait_for_load_state("networkidle", timeout=20000)
-                     time.sleep(5)
+                     await view_all_toggle.check(force=True)
+                     await self._wait_for_more_cards(page, initial_count, timeout=15000)
             else:
                  # Try clicking the label text if input not found
-                 view_all_text = page.get_by_text("View All", exact=False)
-                 if view_all_text.count() > 0:
-                     logger.info("Clicking 'View All' text...")
-                     view_all_text.first.click(force=True)
-                     page.wait_for_load_state("networkidle", timeout=20000)
-                     time.sleep(5)
+                 try:
+                     await page.get_by_text("View All", exact=False).first.click(force=True, timeout=2000)
+                     logger.info("Clicked 'View All' text.")
+                     await self._wait_for_more_cards(page, initial_count, timeout=15000)
+                 except PlaywrightTimeoutError:
+                     pass
                      
         except Exception as e:
             logger.debug(f"View All toggle check skipped: {e}")
 
+        listing_products = []
+        # Lazy-load re-renders can repeat cards, so skip URLs already collected
+        seen = set()
+
+        async def collect(final=False):
+            if final:
+                products = self._parse_listing_cards(await page.content(), seen)
+            else:
+                products = self._new_listing_products(await page.evaluate(CARD_LINKS_JS, card_selectors), seen)
+            listing_products.extend(products)
+            if queue is not None:
+                for product in products:
+                    await queue.put(product)
+
         logger.info("Starting pagination...")
+        if queue is not None:
+            await collect()
+        
+        previous_count = await page.evaluate(CARD_COUNT_JS, card_selectors)
+        deadline = time.monotonic() + self.PAGINATION_TIMEOUT
         
-        previous_count = 0
-        no_change_count = 0
+        # Cleared on a click timeout so scroll-only listings don't wait on it every iteration;
+        # re-armed when a quick visibility check finds a late-rendered button
+        has_load_more = True
         
-        while True:
+        while time.monotonic() < deadline:
             # Scroll to bottom
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(2)
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             
-            # Check for Load More button
-            load_more_btn = page.locator("button:has-text('Load More')").first
-            if not load_more_btn.is_visible():
-                load_more_btn = page.get_by_role("button", name=re.compile("Load More", re.IGNORECASE)).first
-
-            if load_more_btn.is_visible():
-                logger.info("Clicking 'Load More'...")
+            # click() waits for the button and scrolls it into view in one call;
+            # a timeout means there is no Load More button (any more)
+            if has_load_more:
                 try:
-                    load_more_btn.scroll_into_view_if_needed()
-                    load_more_btn.click(force=True)
-                    
-                    try:
-                        page.wait_for_load_state("networkidle", timeout=8000)
-                    except Exception:
-                        pass
-                    
-                    time.sleep(3) 
-                    no_change_count = 0 
+                    await load_more_btn.click(force=True, timeout=2000)
+                    logger.info("Clicked 'Load More'.")
+                except PlaywrightTimeoutError:
+                    has_load_more = False
                 except Exception as e:
                     logger.error(f"Error interacting with 'Load More': {e}")
-                    time.sleep(2)
-            else:
+            
+            if not has_load_more:
                 # If "Load More" is missing, check if we need to force scroll for "View All" lazy loading
                 # Even with "View All" on, items are often lazy-loaded as you scroll down.
                 
                 # Check for "View All" toggle again, ensure it's on
                 try:
-                    toggle = page.locator("input[type='checkbox'][aria-label*='View All']").first
-                    if toggle.is_visible() and not toggle.is_checked():
+                    if await view_all_toggle.is_visible() and not await view_all_toggle.is_checked():
                         logger.info("Re-enabling 'View All' toggle...")
-                        toggle.check(force=True)
-                        time.sleep(5)
+                        await view_all_toggle.check(force=True)
                 except:
                     pass
 
-                current_count = page.locator("div[class*='mh-product-card']").count()
-                if current_count == 0:
-                     # Fallback selector
-                     current_count = page.locator("div[role='group'][aria-label]").count()
-                
-                if current_count > previous_count:
-                    logger.info(f"Loaded more items: {current_count} (was {previous_count})")
-                    previous_count = current_count
-                    no_change_count = 0
+                # Force scroll a bit more aggressively
+                await page.mouse.wheel(0, 5000)
+            
+            # Proceed as soon as new cards render instead of sleeping a fixed amount
+            grew = await self._wait_for_more_cards(page, previous_count)
+            rearmed = not has_load_more and await load_more_btn.is_visible()
+            if rearmed:
+                has_load_more = True
+            if not grew:
+                # A button that only just appeared gets one click before giving up
+                if rearmed:
                     continue
-                else:
-                    # Force scroll a bit more aggressively
-                    page.mouse.wheel(0, 5000)
-                    time.sleep(1)
-                    
-                    no_change_count += 1
-                    logger.info(f"No new items loaded. Attempt {no_change_count}/10")
-                    if no_change_count >= 10:
-                        logger.info("Content stabilized. Stopping pagination.")
-                        break
-                    time.sleep(2)
+                logger.info("Content stabilized. Stopping pagination.")
+                break
+            
+            current_count = await page.evaluate(CARD_COUNT_JS, card_selectors)
+            logger.info(f"Loaded more items: {current_count} (was {previous_count})")
+            previous_count = current_count
+            if queue is not None:
+                await collect()
+        else:
+            logger.warning(f"Pagination stopped after {self.PAGINATION_TIMEOUT}s deadline.")
         
-        content = page.content()
-        soup = BeautifulSoup(content, "html.parser")
+        # One full HTML parse at the end catches anything the in-page reads missed
+        await collect(final=True)
+        logger.info(f"Found {len(listing_products)} products.")
+        return listing_products
+
+    async def _wait_for_more_cards(self, page, previous_count, timeout=10000):
+        """
+        Waits until more than `previous_count` product cards are rendered. Returns False on timeout.
+        """
+        try:
+            await page.wait_for_function(
+                CARDS_GREW_JS,
+                arg=[CARD_SELECTOR, CARD_FALLBACK_SELECTOR, previous_count],
+                timeout=timeout
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    def _parse_listing_cards(self, content, seen):
+        """
+        Parses product cards from listing HTML, skipping and recording URLs in `seen`.
+        """
+        tree = LexborHTMLParser(content)
         
-        cards = soup.find_all("div", class_=re.compile("mh-product-card"))
+        cards = tree.css(CARD_SELECTOR)
         if not cards:
-             cards = soup.find_all("div", attrs={"role": "group"})
-             cards = [c for c in cards if c.get("aria-label")]
-        
-        logger.info(f"Found {len(cards)} product cards.")
+             cards = tree.css(CARD_FALLBACK_SELECTOR)
         
-        listing_products = []
+        links = []
         for card in cards:
             try:
-                name = card.get("aria-label") or card.find("h3").get_text(strip=True)
-                link_tag = card.find("a", href=True)
-                if not link_tag:
-                    link_tag = card.find_parent("a", href=True)
+                name = card.attributes.get("aria-label") or card.css_first("h3").text(strip=True)
+                link_tag = card.css_first("a[href]")
+                if link_tag is None:
+                    # Some cards are wrapped in the link instead of containing it
+                    link_tag = card.parent
+                    while link_tag is not None and not (link_tag.tag == "a" and link_tag.attributes.get("href")):
+                        link_tag = link_tag.parent
                 
-                if link_tag:
-                    product_url = urljoin(self.BASE_URL, link_tag['href'])
-                    listing_products.append({"name": name, "url": product_url})
+                if link_tag is not None:
+                    links.append((name, link_tag.attributes['href']))
             except Exception:
                 continue
                 
-        unique = {p['url']: p for p in listing_products}.values()
-        return list(unique)
+        return self._new_listing_products(links, seen)
+
+    def _new_listing_products(self, links, seen):
+        """
+        Turns (name, href) card pairs into products, skipping and recording URLs in `seen`.
+        """
+        products = []
+        for name, href in links:
+            product_url = urljoin(self.BASE_URL, href)
+            if product_url in seen:
+                continue
+            seen.add(product_url)
+            products.append({"name": name, "url": product_url})
+        return products
 
     @retry(times=2, delay=2)
-    def extract_product_details(self, page, url):
+    async def extract_product_details(self, url, page=None):
+        """
+        Scrapes one product. The browser is only used when the cache and HTTP fetch miss or the
+        fetched HTML has no rating; if no page is given, one is then borrowed from the page pool
+        until parsing is done.
+        """
         logger.info(f"Scraping product details: {url}")
-        # Optimized goto to avoid full load wait
-        page.goto(url, timeout=45000, wait_until="domcontentloaded")
-        
+        borrowed = None
         try:
-            # Wait up to 5s for the rating container to appear
-            page.wait_for_selector(".bv_avgRating_component_container", state="attached", timeout=5000)
-        except:
-            # Proceed anyway if not found (might be no reviews)
-            pass
+            # Cache I/O and (de)compression run off the event loop so other fetches keep going
+            content = await asyncio.to_thread(_cache_get, url) if self.use_cache else None
+            next_data = _NEXT_DATA_RE.search(content) if content else None
+            cached = bool(next_data)
+            data = bv_data = None
+            if cached:
+                logger.debug(f"Using cached page for {url}")
+            elif self._http:
+                # __NEXT_DATA__ is server-rendered, so a plain HTTP fetch is usually enough
+                content = await self._fetch_html(url)
+                next_data = _NEXT_DATA_RE.search(content) if content else None
+                if next_data and not _has_rating(content):
+                    # Without JSON-LD the rating is only rendered client-side by Bazaarvoice
+                    logger.debug(f"No server-rendered rating for {url}")
+                    next_data = None
         
-        content = page.content()
-        soup = BeautifulSoup(content, "html.parser")
+            if not next_data:
+                logger.info(f"Falling back to browser for {url}")
+                if page is None:
+                    page = borrowed = await self._page_pool.acquire()
+                # Optimized goto to avoid full load wait
+                await page.goto(url, timeout=45000, wait_until="domcontentloaded")
+            
+                try:
+                    # Wait up to 5s for the rating container to appear
+                    await page.wait_for_selector(".bv_avgRating_component_container", state="attached", timeout=5000)
+                except:
+                    # Proceed anyway if not found (might be no reviews)
+                    pass
+            
+                # The cache needs the serialized page anyway, so the JSON is then parsed from it;
+                # otherwise it is read straight from the DOM instead of serializing the whole page
+                if not self.use_cache:
+                    try:
+                        data, bv_data = await page.evaluate(PAGE_JSON_JS)
+                    except Exception as e:
+                        logger.debug(f"In-page JSON extraction failed for {url}: {e}")
+            
+                if data is None:
+                    content = await page.content()
+                    next_data = _NEXT_DATA_RE.search(content)
+                    if not next_data:
+                        logger.warning(f"No JSON data found for {url}")
+                        return None
+                else:
+                    # Only fetched later if a DOM fallback needs it
+                    content = None
         
-        next_data = soup.find("script", id="__NEXT_DATA__")
-        if not next_data:
-            logger.warning(f"No JSON data found for {url}")
-            return None
+            if next_data and self.use_cache and not cached:
+                await asyncio.to_thread(_cache_put, url, content)
             
-        try:
-            data = json.loads(next_data.string)
-            prod = data.get("props", {}).get("pageProps", {}).get("productData", {}).get("product", {})
+            try:
+                if data is None:
+                    data = orjson.loads(next_data.group(1))
+                prod = data.get("props", {}).get("pageProps", {}).get("productData", {}).get("product", {})
             
-            if not prod:
-                return None
+                if not prod:
+                    return None
             
-            sku = prod.get("sku")
-            name = prod.get("title") or prod.get("modelName")
-            price = prod.get("price", {}).get("finalPrice") or prod.get("obsSellingPrice")
-            stock = prod.get("stockStatus", {}).get("statusCode")
+                sku = prod.get("sku")
+                name = prod.get("title") or prod.get("modelName")
+                price = prod.get("price", {}).get("finalPrice") or prod.get("obsSellingPrice")
+                stock = prod.get("stockStatus", {}).get("statusCode")
             
-            features = []
-            for f in prod.get("keyFeatures", []):
-                if isinstance(f, dict):
-                    feat = f.get("feature") or f.get("featureTitle")
-                    if feat: features.append(self.clean_text(feat))
-                else:
-                    features.append(self.clean_text(str(f)))
+                clean = self.clean_text
+                features = [
+                    clean(feat)
+                    for f in prod.get("keyFeatures", [])
+                    if (feat := (f.get("feature") or f.get("featureTitle")) if isinstance(f, dict) else str(f))
+                ]
             
-            specs = []
-            tech_specs = prod.get("techSpec", {})
-            if isinstance(tech_specs, dict) and tech_specs.get("spec"):
-                 spec_groups = tech_specs.get("spec", [])
-                 for group in spec_groups:
-                     g_name = group.get("groupName", "General")
-                     for item in group.get("specs", []):
-                         specs.append({
-                             "group": g_name,
-                             "name": item.get("name"),
-                             "value": self.clean_text(item.get("value"))
-                         })
+                tech_specs = prod.get("techSpec", {})
+                spec_groups = tech_specs.get("spec") if isinstance(tech_specs, dict) else None
+                specs = [
+                    {
+                        "group": group.get("groupName", "General"),
+                        "name": item.get("name"),
+                        "value": clean(item.get("value"))
+                    }
+                    for group in spec_groups or ()
+                    for item in group.get("specs", [])
+                ]
             
-            # DOM Fallback for Specs (if JSON missing)
-            if not specs:
-                known_keys = ["Display Resolution", "Resolution", "Screen Size", "Refresh Rate", "Speakers","Power", "Sound", "Capacity", "Dimensions"]
-                found_key = None
-                for key in known_keys:
-                    found_key = soup.find(string=lambda t: t and key == t.strip())
-                    if found_key:
-                        break
-                
-                if found_key:
-                    # found_key -> div -> div (row container) -> div (list container)
-                    # Structure observed: Row -> [Div(Key), Div(Value)]
+                # DOM Fallback for Specs (if JSON missing)
+                if not specs:
                     try:
-                        # Go up to the row container
-                        # Structure: <div row> <div key_wrap> <div key>...</div> </div> <div val_wrap>...</div> </div>
-                        # found_key.parent is the div containing text
-                        # found_key.parent.parent is the key_wrap
-                        # found_key.parent.parent.parent is likely the row
-                        
-                        current = found_key.parent
-                        row = None
-                        # Traverse up max 4 levels to find a container with >1 div children
-                        for _ in range(4):
-                            if current.name == 'div' and len(current.find_all('div', recursive=False)) >= 2:
-                                row = current
+                        if content is None:
+                            content = await page.content()
+                        tree = lxml.html.fromstring(content)
+                        found_key = None
+                        for key in KNOWN_SPEC_KEYS:
+                            found_key = next(iter(_SPEC_KEY_XPATH(tree, key=key)), None)
+                            if found_key is not None:
                                 break
-                            current = current.parent
+                    
+                        if found_key is not None:
+                            # Structure observed: List -> Row -> [Div(Key), Div(Value)]
+                            # found_key is the element holding the key text; the row is
+                            # the nearest div (max 4 levels up) with more than one div child
+                            current = found_key
+                            row = None
+                            for _ in range(4):
+                                if current is None:
+                                    break
+                                if current.tag == 'div' and len(_CHILD_DIVS_XPATH(current)) >= 2:
+                                    row = current
+                                    break
+                                current = current.getparent()
                         
-                        if row:
-                            # Now find the parent list container
-                            list_container = row.parent
-                            # Iterate all rows in this list
-                            for row_div in list_container.find_all('div', recursive=False):
-                                cols = row_div.find_all('div', recursive=False)
-                                if len(cols) >= 2:
-                                    k = cols[0].get_text(strip=True)
-                                    v = cols[1].get_text(strip=True)
-                                    if k and v:
-                                        specs.append({"name": k, "value": self.clean_text(v)})
+                            if row is not None:
+                                # Iterate all rows in the parent list container
+                                for row_div in _CHILD_DIVS_XPATH(row.getparent()):
+                                    cols = _CHILD_DIVS_XPATH(row_div)
+                                    if len(cols) >= 2:
+                                        k = _TEXT_XPATH(cols[0])
+                                        v = _TEXT_XPATH(cols[1])
+                                        if k and v:
+                                            specs.append({"name": k, "value": self.clean_text(v)})
                     except Exception:
                         pass
             
-            rating = "N/A"
-            try:
-                # Method 1: JSON-LD (Preferred)
-                bv_script = soup.find("script", id="bv-jsonld-reviews-data")
-                if bv_script:
-                    bv_data = json.loads(bv_script.string)
-                    agg = bv_data.get("aggregateRating")
-                    if agg:
-                        rating = agg.get("ratingValue")
+                rating = "N/A"
+                try:
+                    # Method 1: JSON-LD (Preferred)
+                    if bv_data is None and content is not None:
+                        bv_script = _BV_JSONLD_RE.search(content)
+                        if bv_script:
+                            bv_data = orjson.loads(bv_script.group(1))
+                    if bv_data:
+                        agg = bv_data.get("aggregateRating")
+                        if agg:
+                            rating = agg.get("ratingValue")
                 
-                # Method 2: Fallback to DOM parsing if JSON-LD missing or incomplete
-                if rating == "N/A":
-                    # Strategies: 
-                    # 1. Offscreen text (e.g., "3.8 out of 5 stars")
-                    # 2. Visual container (e.g., "4.8")
-                    fallback_selectors = [
-                        ("span", "bv_offscreen_text"),
-                        ("div", "bv_avgRating_component_container")
-                    ]
-                    
-                    for tag, cls in fallback_selectors:
-                        elem = soup.find(tag, class_=cls)
-                        if elem:
-                            # Extract the first float-like number found in the text
-                            match = re.search(r"(\d+(\.\d+)?)", elem.get_text(strip=True))
-                            if match:
-                                rating = match.group(1)
-                                break
-            except Exception:
-                pass
-
-            return {
-                "name": name,
-                "sku_id": sku,
-                "url": url,
-                "price": price,
-                "rating": rating,
-                "stock_availability": stock,
-                "key_features": features,
-                "specifications": specs
-            }
-        except Exception as e:
-            logger.error(f"JSON parsing error: {e}")
-            return None
+                    # Method 2: Fallback to the rating markup if JSON-LD missing or incomplete
+                    if rating == "N/A":
+                        if content is None:
+                            content = await page.content()
+                        rating = _rating_from_markup(content) or rating
+                except Exception:
+                    pass
 
-    def run(self, category_query):
-        self.discover_categories()
-        
-        target_url = self.get_category_url(category_query)
-        if not target_url:
-            logger.error("Could not determine category URL.")
-            return
-            
-        with sync_playwright() as p:
-            # Use specific User-Agent to avoid headless detection
-            browser = p.firefox.launch(headless=self.headless)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/115.0",
+                return {
+                    "name": name,
+                    "sku_id": sku,
+                    "url": url,
+                    "price": price,
+                    "rating": rating,
+                    "stock_availability": stock,
+                    "key_features": features,
+                    "specifications": specs
+                }
+            except Exception as e:
+                logger.error(f"JSON parsing error: {e}")
+                return None
+        finally:
+            if borrowed is not None:
+                await self._page_pool.release(borrowed)
+
+    async def _stream_listing(self, page, url, queue):
+        """
+        Producer for run(): scrapes the listing into `queue`, then signals each worker to stop.
+        """
+        try:
+            return await self.scrape_listing_page(page, url, queue)
+        finally:
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+    async def run(self, category_query, json_array=False, resume=False):
+        async with async_playwright() as p, httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": USER_AGENT},
+            timeout=30,
+            follow_redirects=True
+        ) as http:
+            self._http = http
+            browser = await p.firefox.launch(headless=self.headless)
+            context = await browser.new_context(
+                user_agent=USER_AGENT,
                 viewport={"width": 1920, "height": 1080}
             )
-            page = context.new_page()
+            await context.route("**/*", self._block_heavy_requests)
+            page = await context.new_page()
             
-            listings = self.scrape_listing_page(page, target_url)
+            if not self._load_cached_categories():
+                # Discover categories on a second page of the same browser while the
+                # listing page speculatively loads the URL the query most likely maps to
+                discover_page = await context.new_page()
+                try:
+                    await asyncio.gather(
+                        self._discover_on(discover_page),
+                        self._prefetch(page, self._slug_url(category_query))
+                    )
+                finally:
+                    await discover_page.close()
             
-            if listings:
-                logger.info(f"Processing {len(listings)} products...")
-                results = []
-                for item in listings:
-                    details = self.extract_product_details(page, item['url'])
-                    if details:
-                        results.append(details)
-                    time.sleep(1)
-                
-                filename = SCRAPER_DIR / f"lg_{category_query.replace(' ', '_')}.json"
-                with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(results, f, indent=2)
-                logger.info(f"Saved {len(results)} products to {filename}")
-            else:
+            target_url = self.get_category_url(category_query)
+            if not target_url:
+                logger.error("Could not determine category URL.")
+                return
+            
+            # Pool size bounds how many detail pages use the browser at once
+            self._page_pool = PagePool(context, self.browser_pages, self.PAGE_MAX_USES)
+            await self._page_pool.start()
+            
+            # Detail workers consume products while the listing is still paginating
+            queue = asyncio.Queue()
+            producer = asyncio.create_task(self._stream_listing(page, target_url, queue))
+            # Each product is written as one JSON line as soon as it is scraped
+            filename = SCRAPER_DIR / f"lg_{category_query.replace(' ', '_')}.jsonl"
+            done = set()
+            if resume and filename.exists():
+                done = _saved_urls(filename)
+                logger.info(f"Resuming: skipping {len(done)} products already in {filename}")
+            
+            # Guards against re-queued products on listing retries and already saved ones
+            scheduled = set(done)
+            saved = 0
+            
+            out = None
+
+            async def worker():
+                nonlocal saved, out
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    if item['url'] in scheduled:
+                        continue
+                    scheduled.add(item['url'])
+                    # One failing product must not take the worker (and the queue draining) down with it
+                    try:
+                        details = await self.extract_product_details(item['url'])
+                        if details:
+                            if out is None:
+                                # Opened on the first product so a run that saves nothing leaves the previous output alone
+                                out = open(filename, "ab" if resume else "wb")
+                            out.write(orjson.dumps(details) + b"\n")
+                            out.flush()
+                            saved += 1
+                    except RETRYABLE_ERRORS as e:
+                        logger.error(f"Giving up on {item['url']}: {e}")
+                    except Exception as e:
+                        logger.error(f"Failed to scrape {item['url']}: {e!r}")
+
+            # A crashed worker must not cancel the others or orphan the producer
+            try:
+                outcomes = await asyncio.gather(*(worker() for _ in range(self.concurrency)), return_exceptions=True)
+            finally:
+                if out is not None:
+                    out.close()
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    logger.error(f"Detail worker failed: {outcome}")
+            try:
+                listings = await producer
+            except RETRYABLE_ERRORS as e:
+                logger.error(f"Listing scrape failed: {e}")
+                listings = None
+            
+            if not listings:
                 logger.error("No products found in listing.")
+            # Products streamed before a listing failure are still worth keeping
+            if saved or done:
+                logger.info(f"Saved {saved} of {len(scheduled) - len(done)} products to {filename}")
+                if json_array:
+                    array_file = jsonl_to_json(filename)
+                    logger.info(f"Converted {filename} to {array_file}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="LG Product Scraper")
     parser.add_argument('category', default='oled tvs', help='Category to scrape')
+    parser.add_argument('--concurrency', type=int, default=LGScraper.CONCURRENCY, help='Max product pages scraped in parallel')
+    parser.add_argument('--browser-pages', type=int, default=LGScraper.BROWSER_PAGES, help='Browser pages kept for products that need JavaScript rendering')
+    parser.add_argument('--json-array', action='store_true', help='Also convert the JSON Lines output to a JSON array file')
+    parser.add_argument('--resume', action='store_true', help='Append to an existing JSON Lines output, skipping products already saved')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not write the on-disk product page cache')
+    parser.add_argument('--refresh-categories', action='store_true', help='Rediscover categories even if the cached list is fresh')
     args = parser.parse_args()
 
-    scraper = LGScraper(headless=True)
-    scraper.run(args.category)
\ No newline at end of file
+    # uvloop's libuv-based event loop handles high fan-out socket I/O faster (not available on Windows)
+    run = asyncio.run
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            run = uvloop.run
+        except ImportError:
+            logger.debug("uvloop not installed, using the default asyncio event loop.")
+
+    scraper = LGScraper(
+        headless=True,
+        concurrency=args.concurrency,
+        browser_pages=args.browser_pages,
+        use_cache=not args.no_cache,
+        refresh_categories=args.refresh_categories
+    )
+    run(scraper.run(args.category, json_array=args.json_array, resume=args.resume))